@@ -87,10 +87,11 @@ class SenticGCNEmbeddingConfig(PretrainedConfig):
         PretrainedConfig (:obj:`PretrainedConfig`): transformer :obj:`PretrainedConfig` base class
     """
 
-    def __init__(self, vocab_size: int = 17662, embed_dim: int = 300, **kwargs) -> None:
+    def __init__(self, vocab_size: int = 17662, embed_dim: int = 300, sparse: bool = False, **kwargs) -> None:
         super().__init__(**kwargs)
         self.vocab_size = vocab_size
         self.embed_dim = embed_dim
+        self.sparse = sparse
 
 
 class SenticGCNBertEmbeddingConfig(BertConfig):
@@ -43,6 +43,18 @@ class SenticGCNTrainArgs:
         default_factory=list,
         metadata={"help": "List of file path to test dataset(s)."},
     )
+    save_preprocessed_dataset: bool = field(
+        default=False,
+        metadata={
+            "help": """Flag to indicate if the preprocessed train and test datasets should be cached to disk.
+                    Subsequent runs with unchanged dataset files and tokenizer will load the preprocessed
+                    dataset from cache instead of re-tokenizing the raw dataset files."""
+        },
+    )
+    saved_preprocessed_dataset_folder: str = field(
+        default="preprocessed_dataset",
+        metadata={"help": "Folder to save cached preprocessed datasets, keyed by dataset files and tokenizer."},
+    )
     valset_ratio: float = field(
         default=0.0,
         metadata={
@@ -145,6 +157,10 @@ class SenticGCNTrainArgs:
     l2reg: float = field(default=0.00001, metadata={"help": "Default l2reg value."})
     epochs: int = field(default=100, metadata={"help": "Number of epochs to train."})
     batch_size: int = field(default=16, metadata={"help": "Training batch size."})
+    num_workers: int = field(
+        default=0,
+        metadata={"help": "Number of dataloader worker processes. Set above 0 to collate batches in parallel."},
+    )
     log_step: int = field(default=5, metadata={"help": "Number of train steps to log results."})
     embed_dim: int = field(default=300, metadata={"help": "Size of embedding."})
     hidden_dim: int = field(default=300, metadata={"help": "Number of neurons for hidden layer."})
@@ -292,7 +292,7 @@ class SenticGCNEmbeddingModel(SenticGCNEmbeddingPreTrainedModel):
     def __init__(self, config: SenticGCNEmbeddingConfig) -> None:
         super().__init__(config)
         self.vocab_size = config.vocab_size
-        self.embed = nn.Embedding(config.vocab_size, config.embed_dim)
+        self.embed = nn.Embedding(config.vocab_size, config.embed_dim, sparse=getattr(config, "sparse", False))
 
     def forward(self, token_ids: torch.Tensor) -> torch.Tensor:
         """
@@ -312,6 +312,7 @@ class SenticGCNEmbeddingModel(SenticGCNEmbeddingPreTrainedModel):
         word_vec_file_path: str,
         vocab: Dict[str, int],
         embed_dim: int = 300,
+        sparse: bool = False,
     ):
         """
         This class method is a helper method to construct the embedding model from a file containing word vectors (i.e. GloVe)
@@ -321,6 +322,10 @@ class SenticGCNEmbeddingModel(SenticGCNEmbeddingPreTrainedModel):
             word_vec_file_path (str): file path to the word vectors
             vocab (Dict[str, int]): vocab dictionary consisting of words as key and index as values
             embed_dim (int, optional): the embedding dimension. Defaults to 300.
+            sparse (bool, optional): construct the embedding with sparse gradients, which keeps backward
+                memory proportional to the tokens seen per batch instead of the full vocab.
+                Requires a sparse-aware optimizer (e.g. torch.optim.SparseAdam) when the embedding
+                weights are trained. Defaults to False.
 
         Returns:
             SenticGCNEmbeddingModel: return an instance of SenticGCNEmbeddingModel
@@ -329,7 +334,7 @@ class SenticGCNEmbeddingModel(SenticGCNEmbeddingPreTrainedModel):
             word_vec_file_path=word_vec_file_path, vocab=vocab, embed_dim=embed_dim
         )
         embedding_tensor = torch.tensor(embedding_matrix, dtype=torch.float)
-        sentic_embed_config = SenticGCNEmbeddingConfig(vocab_size=len(vocab), embed_dim=embed_dim)
+        sentic_embed_config = SenticGCNEmbeddingConfig(vocab_size=len(vocab), embed_dim=embed_dim, sparse=sparse)
         senticgcn_embed = cls(sentic_embed_config)
         senticgcn_embed.embed.weight.data.copy_(embedding_tensor)
         return senticgcn_embed
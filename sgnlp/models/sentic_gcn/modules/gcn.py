@@ -17,6 +17,8 @@ class GraphConvolution(nn.Module):
 
     def forward(self, text: torch.Tensor, adj: torch.Tensor):
         text = text.to(torch.float32)
+        # adj batches travel as float16, upcast just-in-time for the matmul
+        adj = adj.to(torch.float32)
         hidden = torch.matmul(text, self.weight)
         denom = torch.sum(adj, dim=2, keepdim=True) + 1
         output = torch.matmul(adj, hidden) / denom
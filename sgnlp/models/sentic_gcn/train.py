@@ -24,7 +24,14 @@ from .modeling import (
     SenticGCNBertEmbeddingModel,
 )
 from .tokenization import SenticGCNTokenizer, SenticGCNBertTokenizer
-from .utils import parse_args_and_load_config, set_random_seed, SenticGCNDatasetGenerator, BucketIterator
+from .utils import (
+    parse_args_and_load_config,
+    set_random_seed,
+    bucket_collate_fn,
+    BucketBatchSampler,
+    BucketIterator,
+    SenticGCNDatasetGenerator,
+)
 
 
 logging.basicConfig(level=logging.DEBUG)
@@ -146,8 +153,8 @@ class SenticGCNBaseTrainer:
                 t_batch["text_embeddings"] = self._generate_embeddings(t_batch)
 
                 # Prepare input data and targets
-                t_inputs = [t_batch[col].to(self.device) for col in self.config.data_cols]
-                t_targets = t_batch["polarity"].to(self.device)
+                t_inputs = [t_batch[col].to(self.device, non_blocking=True) for col in self.config.data_cols]
+                t_targets = t_batch["polarity"].to(self.device, non_blocking=True)
 
                 # Inference
                 t_outputs = self.model(t_inputs)
@@ -193,8 +200,8 @@ class SenticGCNBaseTrainer:
                 batch["text_embeddings"] = self._generate_embeddings(batch)
 
                 # Prepare input data and targets
-                inputs = [batch[col].to(self.device) for col in self.config.data_cols]
-                targets = batch["polarity"].to(self.device)
+                inputs = [batch[col].to(self.device, non_blocking=True) for col in self.config.data_cols]
+                targets = batch["polarity"].to(self.device, non_blocking=True)
 
                 # Inference
                 outputs = self.model(inputs)
@@ -373,9 +380,28 @@ class SenticGCNBertTrainer(SenticGCNBaseTrainer):
         Returns:
             Tuple[DataLoader, DataLoader, DataLoader]: return train, val and test dataloaders.
         """
-        train_dataloader = DataLoader(self.train_data, batch_size=self.config.batch_size, shuffle=True)
-        val_dataloader = DataLoader(self.val_data, batch_size=self.config.batch_size, shuffle=False)
-        test_dataloader = DataLoader(self.test_data, batch_size=self.config.batch_size, shuffle=False)
+        pin_memory = torch.cuda.is_available()
+        train_dataloader = DataLoader(
+            self.train_data,
+            batch_size=self.config.batch_size,
+            shuffle=True,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
+        val_dataloader = DataLoader(
+            self.val_data,
+            batch_size=self.config.batch_size,
+            shuffle=False,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
+        test_dataloader = DataLoader(
+            self.test_data,
+            batch_size=self.config.batch_size,
+            shuffle=False,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
         return train_dataloader, val_dataloader, test_dataloader
 
     def _generate_embeddings(self, batch: List[torch.Tensor]) -> torch.Tensor:
@@ -388,8 +414,8 @@ class SenticGCNBertTrainer(SenticGCNBaseTrainer):
         Returns:
             torch.Tensor: return embedding tensor
         """
-        text_bert_indices = batch["text_bert_indices"].to(self.device)
-        bert_segment_indices = batch["bert_segment_indices"].to(self.device)
+        text_bert_indices = batch["text_bert_indices"].to(self.device, non_blocking=True)
+        bert_segment_indices = batch["bert_segment_indices"].to(self.device, non_blocking=True)
 
         return self.embed(text_bert_indices, token_type_ids=bert_segment_indices)["last_hidden_state"]
 
@@ -530,16 +556,37 @@ class SenticGCNTrainer(SenticGCNBaseTrainer):
                     stdv = 1.0 / math.sqrt(param.shape[0])
                     nn.init.uniform_(param, a=-stdv, b=stdv)
 
-    def _generate_data_loaders(self) -> Tuple[BucketIterator, BucketIterator, BucketIterator]:
+    def _generate_data_loaders(self) -> Tuple[DataLoader, DataLoader, DataLoader]:
         """
         Private helper method to generate train, val and test dataloaders.
+        Batches are length-bucketed via BucketBatchSampler and padded by bucket_collate_fn,
+        while DataLoader provides worker processes, pinned memory and prefetching.
 
         Returns:
-            Tuple[BucketIterator, BucketIterator, BucketIterator]: return train, val and test bucketiterators.
+            Tuple[DataLoader, DataLoader, DataLoader]: return train, val and test dataloaders.
         """
-        train_dataloader = BucketIterator(self.train_data, batch_size=self.config.batch_size, shuffle=True)
-        val_dataloader = BucketIterator(self.val_data, batch_size=self.config.batch_size, shuffle=False)
-        test_dataloader = BucketIterator(self.test_data, batch_size=self.config.batch_size, shuffle=False)
+        pin_memory = torch.cuda.is_available()
+        train_dataloader = DataLoader(
+            self.train_data,
+            batch_sampler=BucketBatchSampler(self.train_data, batch_size=self.config.batch_size, shuffle=True),
+            collate_fn=bucket_collate_fn,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
+        val_dataloader = DataLoader(
+            self.val_data,
+            batch_sampler=BucketBatchSampler(self.val_data, batch_size=self.config.batch_size, shuffle=False),
+            collate_fn=bucket_collate_fn,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
+        test_dataloader = DataLoader(
+            self.test_data,
+            batch_sampler=BucketBatchSampler(self.test_data, batch_size=self.config.batch_size, shuffle=False),
+            collate_fn=bucket_collate_fn,
+            num_workers=self.config.num_workers,
+            pin_memory=pin_memory,
+        )
         return train_dataloader, val_dataloader, test_dataloader
 
     def _generate_embeddings(self, batch: List[torch.Tensor]) -> torch.Tensor:
@@ -552,7 +599,7 @@ class SenticGCNTrainer(SenticGCNBaseTrainer):
         Returns:
             torch.Tensor: return embedding tensor
         """
-        text_indices = batch["text_indices"].to(self.device)
+        text_indices = batch["text_indices"].to(self.device, non_blocking=True)
         return self.embed(text_indices)
 
     def train(self) -> None:
@@ -1,6 +1,8 @@
 import argparse
+import hashlib
 import json
 import logging
+import multiprocessing
 import pickle
 import random
 import pathlib
@@ -14,7 +16,7 @@ from typing import Dict, List, Tuple, Union
 import numpy as np
 import spacy
 import torch
-from torch.utils.data import random_split, Dataset
+from torch.utils.data import random_split, Dataset, Sampler
 from transformers import PreTrainedTokenizer
 from transformers.tokenization_utils_base import BatchEncoding
 
@@ -41,18 +43,25 @@ def parse_args_and_load_config(
     return sentic_asgcn_args
 
 
-def set_random_seed(seed: int = 776) -> None:
+def set_random_seed(seed: int = 776, deterministic: bool = False) -> None:
     """Helper method to set random seeds for python, numpy and torch
 
     Args:
         seed (int, optional): seed value to set. Defaults to 776.
+        deterministic (bool, optional): flag to force deterministic cuDNN algorithms and
+            disable autotuning for fully reproducible runs, which can cost a significant
+            slowdown on convolution/GEMM heavy workloads. Defaults to False, letting
+            cuDNN benchmark and pick the fastest algorithms for the observed input shapes.
     """
     random.seed(seed)
     np.random.seed(seed)
     torch.manual_seed(seed)
     torch.cuda.manual_seed(seed)
-    torch.backends.cudnn.deterministic = True
-    torch.backends.cudnn.benchmark = False
+    if deterministic:
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+    else:
+        torch.backends.cudnn.benchmark = True
 
 
 def download_tokenizer_files(
@@ -117,7 +126,7 @@ def pad_and_truncate(
     Returns:
         np.ndarray: return a ndarray padded to the max_len
     """
-    seq_arr = (np.ones(max_len) * value).astype(dtype)
+    seq_arr = np.full(max_len, value, dtype=dtype)
     trunc = sequence[-max_len:] if truncating == "pre" else sequence[:max_len]
     trunc = np.asarray(trunc, dtype=dtype)
     if padding == "post":
@@ -127,26 +136,67 @@ def pad_and_truncate(
     return seq_arr
 
 
-def load_word_vec(word_vec_file_path: str, vocab: Dict[str, int], embed_dim: int = 300) -> Dict[str, np.asarray]:
+def load_word_vec(
+    word_vec_file_path: str, vocab: Dict[str, int], embedding_matrix: np.ndarray, embed_dim: int = 300
+) -> np.ndarray:
     """
     Helper method to load word vectors from file (e.g. GloVe) for each word in vocab.
+    Lines are scanned as raw bytes and only the vectors for words found in vocab are parsed,
+    via numpy instead of per-value python float conversion. Parsed vectors are written
+    directly into the matching row of the preallocated embedding matrix.
 
     Args:
         word_vec_file_path (str): full file path to word vectors.
         vocab (Dict[str, int]): dictionary of vocab word as key and word index as values.
+        embedding_matrix (np.ndarray): preallocated matrix of shape (len(vocab), embed_dim) to populate.
         embed_dim (int, optional): embedding dimension. Defaults to 300.
 
     Returns:
-        Dict[str, np.asarray]: dictionary with words as key and word vectors as values.
+        np.ndarray: the populated embedding matrix.
     """
-    with open(word_vec_file_path, "r", encoding="utf-8", newline="\n", errors="ignore") as fin:
-        word_vec = {}
+    with open(word_vec_file_path, "rb") as fin:
         for line in fin:
-            tokens = line.rstrip().split()
-            word, vec = " ".join(tokens[:-embed_dim]), tokens[-embed_dim:]
-            if word in vocab.keys():
-                word_vec[word] = np.asarray(vec, dtype="float32")
-    return word_vec
+            line = line.rstrip()
+            # Locate the word/vector boundary by scanning embed_dim separators back
+            # from the end of the line, as vocab words may themselves contain spaces.
+            boundary = len(line)
+            for _ in range(embed_dim):
+                boundary = line.rfind(b" ", 0, boundary)
+            idx = vocab.get(line[:boundary].decode("utf-8", errors="ignore"))
+            if idx is not None:
+                embedding_matrix[idx, :] = np.fromstring(line[boundary + 1 :], dtype=np.float32, sep=" ")
+    return embedding_matrix
+
+
+def _load_word_vec_chunk(args: Tuple[str, str, Dict[str, int], Tuple[int, int], int, int]) -> None:
+    """
+    Worker method to parse word vector lines starting within the byte range [start, end)
+    into the shared memory-mapped embedding matrix. Each vocab index maps to a distinct
+    row, so concurrent writes from disjoint byte ranges are race free.
+
+    Args:
+        args: tuple of word vector file path, memmap file path, vocab, matrix shape, start and end byte offsets.
+    """
+    word_vec_file_path, matrix_file_path, vocab, shape, start, end = args
+    embedding_matrix = np.memmap(matrix_file_path, dtype=np.float32, mode="r+", shape=shape)
+    embed_dim = shape[1]
+    with open(word_vec_file_path, "rb") as fin:
+        if start > 0:
+            # Skip any line straddling the chunk start, it belongs to the previous chunk.
+            fin.seek(start - 1)
+            fin.readline()
+        while fin.tell() < end:
+            line = fin.readline()
+            if not line:
+                break
+            line = line.rstrip()
+            boundary = len(line)
+            for _ in range(embed_dim):
+                boundary = line.rfind(b" ", 0, boundary)
+            idx = vocab.get(line[:boundary].decode("utf-8", errors="ignore"))
+            if idx is not None:
+                embedding_matrix[idx, :] = np.fromstring(line[boundary + 1 :], dtype=np.float32, sep=" ")
+    embedding_matrix.flush()
 
 
 def build_embedding_matrix(
@@ -155,34 +205,78 @@ def build_embedding_matrix(
     embed_dim: int = 300,
     save_embed_matrix: bool = False,
     save_embed_file_path: str = None,
+    seed: int = None,
+    num_workers: int = 1,
 ) -> np.ndarray:
     """
     Helper method to generate an embedding matrix.
+    If a saved embedding matrix file is available, and save flag is set to false, it will be
+    memory-mapped from file instead of rebuilt from the word vectors.
 
     Args:
         word_vec_file_path (str): full file path to word vectors.
         vocab (Dict[str, int]): dictionary of vocab word as key and word index as values.
         embed_dim (int, optional): embedding dimension. Defaults to 300.
-        save_embed_matrix (bool, optional): flag to indicate if . Defaults to False.
-        save_embed_directory (str, optional): [description]. Defaults to None.
+        save_embed_matrix (bool, optional): flag to indicate if embedding matrix should be saved. Defaults to False.
+        save_embed_file_path (str, optional): file path to saved embedding matrix. Defaults to None.
+        seed (int, optional): seed for the random out-of-vocab embedding row.
+            Defaults to None, which derives the seed from the global numpy random state.
+        num_workers (int, optional): number of worker processes used to parse the word vector
+            file in parallel over disjoint byte ranges. Defaults to 1 (in-process).
 
     Returns:
         np.array: numpy array of embedding matrix
     """
-    embedding_matrix = np.zeros((len(vocab), embed_dim))
-    embedding_matrix[1, :] = np.random.uniform(-1 / np.sqrt(embed_dim), 1 / np.sqrt(embed_dim), (1, embed_dim))
-    word_vec = load_word_vec(word_vec_file_path, vocab, embed_dim)
-    for word, idx in vocab.items():
-        vec = word_vec.get(word)
-        if vec is not None:
-            embedding_matrix[idx] = vec
+    if save_embed_file_path is not None:
+        save_file_path = pathlib.Path(save_embed_file_path)
+        if save_file_path.exists() and not save_embed_matrix:
+            try:
+                return np.load(save_file_path, mmap_mode="r")
+            except ValueError:
+                # Saved matrix predates the .npy format (e.g. a raw pickle),
+                # rebuild from the word vectors and overwrite the stale file.
+                logging.warning(f"Unable to load saved embedding matrix from {save_embed_file_path}, rebuilding.")
+                save_embed_matrix = True
+
+    embedding_matrix = np.zeros((len(vocab), embed_dim), dtype=np.float32)
+    # Draw the out-of-vocab row as uniform(-1/sqrt(dim), 1/sqrt(dim)) directly in
+    # float32 via the Generator API, avoiding a temporary float64 row. Without an
+    # explicit seed, derive it from the global numpy RNG so runs seeded via
+    # set_random_seed stay reproducible.
+    rng = np.random.default_rng(seed if seed is not None else np.random.randint(2**31))
+    embedding_matrix[1, :] = (2.0 * rng.random(embed_dim, dtype=np.float32) - 1.0) / np.sqrt(embed_dim)
+    if num_workers > 1:
+        # Parsing is embarrassingly parallel over byte ranges of the word vector file:
+        # workers share a memory-mapped matrix and write to disjoint vocab rows.
+        file_size = pathlib.Path(word_vec_file_path).stat().st_size
+        shape = (len(vocab), embed_dim)
+        with tempfile.NamedTemporaryFile(suffix=".dat", delete=False) as tmp_file:
+            matrix_file_path = tmp_file.name
+        try:
+            shared_matrix = np.memmap(matrix_file_path, dtype=np.float32, mode="w+", shape=shape)
+            shared_matrix[:] = embedding_matrix
+            shared_matrix.flush()
+            bounds = [file_size * i // num_workers for i in range(num_workers + 1)]
+            chunk_args = [
+                (word_vec_file_path, matrix_file_path, vocab, shape, bounds[i], bounds[i + 1])
+                for i in range(num_workers)
+            ]
+            with multiprocessing.Pool(num_workers) as pool:
+                pool.map(_load_word_vec_chunk, chunk_args)
+            embedding_matrix[:] = np.memmap(matrix_file_path, dtype=np.float32, mode="r", shape=shape)
+        finally:
+            try:
+                pathlib.Path(matrix_file_path).unlink()
+            except FileNotFoundError:
+                pass
+    else:
+        load_word_vec(word_vec_file_path, vocab, embedding_matrix, embed_dim)
 
     if save_embed_matrix:
-        save_file_path = pathlib.Path(save_embed_file_path)
         if not save_file_path.exists():
             save_file_path.parent.mkdir(exist_ok=True)
         with open(save_file_path, "wb") as fout:
-            pickle.dump(embedding_matrix, fout)
+            np.save(fout, embedding_matrix)
 
     return embedding_matrix
 
@@ -334,8 +428,9 @@ class SenticGCNDatasetGenerator:
         all_lines = []
         for dataset_file in files_path:
             with open(dataset_file, "r", encoding="utf-8", newline="\n", errors="ignore") as f:
-                lines = f.readlines()
-                all_lines = all_lines + lines
+                # Stream lines into the accumulator instead of materializing a per-file
+                # list via readlines and re-copying the accumulated list per file.
+                all_lines.extend(f)
         return all_lines
 
     def _generate_senticgcn_dataset(self, raw_data: List[str]) -> Dict[str, List]:
@@ -348,42 +443,51 @@ class SenticGCNDatasetGenerator:
         Returns:
             Dict[str, List]]: return a dictionary of dataset sub-type and their list of values.
         """
-        all_data = []
+        # Process full text, aspect and polarity index
+        full_texts = []
+        aspects = []
+        lefts = []
+        polarities = []
         for i in range(0, len(raw_data), 3):
-            # Process full text, aspect and polarity index
             text_left, _, text_right = [s.lower().strip() for s in raw_data[i].partition("$T$")]
             aspect = raw_data[i + 1].lower().strip()
-            full_text = f"{text_left} {aspect} {text_right}"
-            polarity = raw_data[i + 2].strip()
-
-            # Process indices
-            text_indices = self.tokenizer(
-                full_text,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            aspect_indices = self.tokenizer(
-                aspect,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            left_indices = self.tokenizer(
-                text_left,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            polarity = int(polarity) + 1
+            full_texts.append(f"{text_left} {aspect} {text_right}")
+            aspects.append(aspect)
+            lefts.append(text_left)
+            polarities.append(int(raw_data[i + 2].strip()) + 1)
+
+        # Process indices with a single batched tokenizer call per field
+        text_indices = self.tokenizer(
+            full_texts,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        aspect_indices = self.tokenizer(
+            aspects,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        left_indices = self.tokenizer(
+            lefts,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+
+        all_data = []
+        for idx, (full_text, aspect, polarity) in enumerate(zip(full_texts, aspects, polarities)):
             graph = generate_dependency_adj_matrix(full_text, aspect, self.senticnet, self.spacy_pipeline)
             all_data.append(
                 {
-                    "text_indices": text_indices["input_ids"],
-                    "aspect_indices": aspect_indices["input_ids"],
-                    "left_indices": left_indices["input_ids"],
+                    "text_indices": text_indices["input_ids"][idx],
+                    "aspect_indices": aspect_indices["input_ids"][idx],
+                    "left_indices": left_indices["input_ids"][idx],
                     "polarity": polarity,
-                    "sdat_graph": graph,
+                    # Sentic weights have a small range, half precision halves the
+                    # memory held by the per-sample graphs.
+                    "sdat_graph": graph.astype(np.float16),
                 }
             )
         return all_data
@@ -398,91 +502,154 @@ class SenticGCNDatasetGenerator:
         Returns:
             Dict[str, List]: return a dictionary of dataset sub-type and their values.
         """
-        all_data = []
         max_len = self.config.max_len
+
+        # Process full text, aspect and polarity index
+        full_texts = []
+        aspects = []
+        lefts = []
+        full_texts_with_bert_tokens = []
+        polarities = []
         for i in range(0, len(raw_data), 3):
-            # Process full text, aspect and polarity index
             text_left, _, text_right = [s.lower().strip() for s in raw_data[i].partition("$T$")]
             aspect = raw_data[i + 1].lower().strip()
-            polarity = raw_data[i + 2].strip()
             full_text = f"{text_left} {aspect} {text_right}"
-            full_text_with_bert_tokens = f"[CLS] {full_text} [SEP] {aspect} [SEP]"
-
-            # Process indices
-            text_indices = self.tokenizer(
-                full_text,
-                max_length=max_len,
-                padding="max_length",
-                truncation=True,
-                add_special_tokens=False,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            aspect_indices = self.tokenizer(
-                aspect,
-                max_length=max_len,
-                padding="max_length",
-                truncation=True,
-                add_special_tokens=False,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            left_indices = self.tokenizer(
-                text_left,
-                max_length=max_len,
-                padding="max_length",
-                truncation=True,
-                add_special_tokens=False,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            polarity = int(polarity) + 1
-
-            # Process bert related indices
-            text_bert_indices = self.tokenizer(
-                full_text_with_bert_tokens,
-                max_length=max_len,
-                padding="max_length",
-                truncation=True,
-                add_special_tokens=False,
-                return_tensors=None,
-                return_attention_mask=False,
-                return_token_type_ids=False,
-            )
-            text_len = np.sum(text_indices["input_ids"] != 0)
-            aspect_len = np.sum(aspect_indices["input_ids"] != 0)
+            full_texts.append(full_text)
+            aspects.append(aspect)
+            lefts.append(text_left)
+            full_texts_with_bert_tokens.append(f"[CLS] {full_text} [SEP] {aspect} [SEP]")
+            polarities.append(int(raw_data[i + 2].strip()) + 1)
+
+        # Process indices with a single batched tokenizer call per field
+        text_indices = self.tokenizer(
+            full_texts,
+            max_length=max_len,
+            padding="max_length",
+            truncation=True,
+            add_special_tokens=False,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        aspect_indices = self.tokenizer(
+            aspects,
+            max_length=max_len,
+            padding="max_length",
+            truncation=True,
+            add_special_tokens=False,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        left_indices = self.tokenizer(
+            lefts,
+            max_length=max_len,
+            padding="max_length",
+            truncation=True,
+            add_special_tokens=False,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
 
-            # array of [0] for texts including [CLS] and [SEP] and [1] for aspect and ending [SEP]
-            concat_segment_indices = [0] * (text_len + 2) + [1] * (aspect_len + 1)
-            concat_segment_indices = pad_and_truncate(concat_segment_indices, max_len)
+        # Process bert related indices
+        text_bert_indices = self.tokenizer(
+            full_texts_with_bert_tokens,
+            max_length=max_len,
+            padding="max_length",
+            truncation=True,
+            add_special_tokens=False,
+            return_tensors=None,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
 
-            # Process graph
+        all_data = []
+        for idx, (full_text, aspect, polarity) in enumerate(zip(full_texts, aspects, polarities)):
+            text_ids = text_indices["input_ids"][idx]
+            aspect_ids = aspect_indices["input_ids"][idx]
+            left_ids = left_indices["input_ids"][idx]
+            text_bert_ids = text_bert_indices["input_ids"][idx]
+
+            text_len = np.sum(text_ids != 0)
+            aspect_len = np.sum(aspect_ids != 0)
+
+            # array of [0] for texts including [CLS] and [SEP] and [1] for aspect and ending [SEP],
+            # written as a slice assignment into a zero array instead of concatenating python lists
+            concat_segment_indices = np.zeros(max_len, dtype="int64")
+            concat_segment_indices[text_len + 2 : text_len + aspect_len + 3] = 1
+
+            # Process graph, writing into a preallocated zero matrix instead of
+            # the allocate-and-copy np.pad performs per sample.
             graph = generate_dependency_adj_matrix(full_text, aspect, self.senticnet, self.spacy_pipeline)
-            sdat_graph = np.pad(
-                graph,
-                (
-                    (0, max_len - graph.shape[0]),
-                    (0, max_len - graph.shape[0]),
-                ),
-                "constant",
-            )
+            sdat_graph = np.zeros((max_len, max_len), dtype="float16")
+            sdat_graph[: graph.shape[0], : graph.shape[0]] = graph
 
             all_data.append(
                 {
-                    "text_indices": torch.tensor(text_indices["input_ids"]),
-                    "aspect_indices": torch.tensor(aspect_indices["input_ids"]),
-                    "left_indices": torch.tensor(left_indices["input_ids"]),
-                    "text_bert_indices": torch.tensor(text_bert_indices["input_ids"]),
+                    "text_indices": torch.tensor(text_ids),
+                    "aspect_indices": torch.tensor(aspect_ids),
+                    "left_indices": torch.tensor(left_ids),
+                    "text_bert_indices": torch.tensor(text_bert_ids),
                     "bert_segment_indices": torch.tensor(concat_segment_indices),
                     "polarity": torch.tensor(polarity),
-                    "sdat_graph": torch.tensor(sdat_graph),
+                    "sdat_graph": torch.from_numpy(sdat_graph),
                 }
             )
         return all_data
 
+    def _saved_preprocessed_dataset_file_path(self, files_path: List[str]) -> pathlib.Path:
+        """
+        Private helper method to derive the cache file path for a preprocessed dataset.
+        The file name is keyed on the dataset files (path, size and modification time),
+        the tokenizer and the model type, so stale caches are never reused.
+
+        Args:
+            files_path (List[str]): list of file paths to the raw dataset files.
+
+        Returns:
+            pathlib.Path: file path to the cached preprocessed dataset.
+        """
+        hasher = hashlib.md5()
+        for dataset_file in files_path:
+            file_stat = pathlib.Path(dataset_file).stat()
+            hasher.update(f"{dataset_file}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode("utf-8"))
+        hasher.update(
+            f"{type(self.tokenizer).__name__}:{getattr(self.tokenizer, 'vocab_size', '')}:{self.config.model}".encode(
+                "utf-8"
+            )
+        )
+        return pathlib.Path(self.config.saved_preprocessed_dataset_folder).joinpath(f"{hasher.hexdigest()}.pkl")
+
+    def _generate_dataset(self, files_path: List[str]) -> List[Dict[str, List]]:
+        """
+        Private helper method to generate a preprocessed dataset from raw dataset files,
+        with optional caching of the result to disk keyed by dataset files and tokenizer.
+
+        Args:
+            files_path (List[str]): list of file paths to the raw dataset files.
+
+        Returns:
+            List[Dict[str, List]]: return a list of dictionaries of dataset values.
+        """
+        if self.config.save_preprocessed_dataset:
+            saved_dataset_file_path = self._saved_preprocessed_dataset_file_path(files_path)
+            if saved_dataset_file_path.exists():
+                with open(saved_dataset_file_path, "rb") as f:
+                    return pickle.load(f)
+
+        raw_data = self._read_raw_dataset(files_path)
+        if self.config.model == "senticgcn":
+            data = self._generate_senticgcn_dataset(raw_data)
+        else:
+            data = self._generate_senticgcnbert_dataset(raw_data)
+
+        if self.config.save_preprocessed_dataset:
+            saved_dataset_file_path.parent.mkdir(exist_ok=True)
+            with open(saved_dataset_file_path, "wb") as f:
+                pickle.dump(data, f)
+        return data
+
     def generate_datasets(self) -> Tuple[SenticGCNDataset, SenticGCNDataset, SenticGCNDataset]:
         """
         Main wrapper method to generate datasets for both SenticGCN and SenticGCNBert based on config.
@@ -491,17 +658,9 @@ class SenticGCNDatasetGenerator:
             Tuple[SenticGCNDataset, SenticGCNDataset, SenticGCNDataset]:
                 return SenticGCNDataset instances for train/val/test data.
         """
-        # Read raw data from dataset files
-        raw_train_data = self._read_raw_dataset(self.config.dataset_train)
-        raw_test_data = self._read_raw_dataset(self.config.dataset_test)
-
-        # Generate dataset dictionary
-        if self.config.model == "senticgcn":
-            train_data = self._generate_senticgcn_dataset(raw_train_data)
-            test_data = self._generate_senticgcn_dataset(raw_test_data)
-        else:
-            train_data = self._generate_senticgcnbert_dataset(raw_train_data)
-            test_data = self._generate_senticgcnbert_dataset(raw_test_data)
+        # Generate dataset dictionary, from cache if enabled and available
+        train_data = self._generate_dataset(self.config.dataset_train)
+        test_data = self._generate_dataset(self.config.dataset_test)
         # Train/Val/Test split
         if self.config.valset_ratio > 0:
             valset_len = int(len(train_data) * self.config.valset_ratio)
@@ -525,6 +684,90 @@ class SenticGCNDatasetGenerator:
         return SenticGCNDataset(test_data)
 
 
+def bucket_collate_fn(batch_data: List[Dict[str, List]], sort_key: str = "text_indices") -> Dict[str, torch.Tensor]:
+    """
+    Collate function which pads each sub dataset to the max length of its specific batch.
+    For use with torch DataLoader and as the padding step of BucketIterator.
+
+    Args:
+        batch_data (List[Dict[str, List]]): list of dataset items to collate into a batch
+        sort_key (str, optional): dataset key used to determine the pad length. Defaults to "text_indices".
+
+    Returns:
+        Dict[str, torch.Tensor]: return a dictionary of batched tensor values
+    """
+    batch_size = len(batch_data)
+    max_len = max([len(t[sort_key]) for t in batch_data])
+
+    # Preallocate the batch tensors once and fill via slice assignment,
+    # padding comes for free from the zero initialization.
+    batch_text_indices = torch.zeros((batch_size, max_len), dtype=torch.long)
+    batch_aspect_indices = torch.zeros((batch_size, max_len), dtype=torch.long)
+    batch_left_indices = torch.zeros((batch_size, max_len), dtype=torch.long)
+    batch_polarity = torch.zeros(batch_size, dtype=torch.long)
+    batch_sdat_graph = np.zeros((batch_size, max_len, max_len), dtype=np.float16)
+    for i, item in enumerate(batch_data):
+        (text_indices, aspect_indices, left_indices, polarity, sdat_graph,) = (
+            item["text_indices"],
+            item["aspect_indices"],
+            item["left_indices"],
+            item["polarity"],
+            item["sdat_graph"],
+        )
+        batch_text_indices[i, : len(text_indices)] = torch.as_tensor(text_indices)
+        batch_aspect_indices[i, : len(aspect_indices)] = torch.as_tensor(aspect_indices)
+        batch_left_indices[i, : len(left_indices)] = torch.as_tensor(left_indices)
+        batch_polarity[i] = polarity
+        batch_sdat_graph[i, : len(text_indices), : len(text_indices)] = sdat_graph
+
+    return {
+        "text_indices": batch_text_indices,
+        "aspect_indices": batch_aspect_indices,
+        "left_indices": batch_left_indices,
+        "polarity": batch_polarity,
+        # from_numpy shares the buffer packed above, no further copy
+        "sdat_graph": torch.from_numpy(batch_sdat_graph),
+    }
+
+
+class BucketBatchSampler(Sampler):
+    """
+    Batch sampler yielding length-bucketed batches of dataset indices.
+    For use with torch DataLoader and bucket_collate_fn, which together replicate the
+    bucketing behaviour of BucketIterator while retaining DataLoader features such as
+    worker processes, pinned memory and prefetching.
+    """
+
+    def __init__(
+        self,
+        data_source: Dataset,
+        batch_size: int,
+        sort_key: str = "text_indices",
+        shuffle: bool = True,
+        sort: bool = True,
+    ) -> None:
+        self.shuffle = shuffle
+        num_batch = int(math.ceil(len(data_source) / batch_size))
+        if sort:
+            lens = np.fromiter(
+                (len(data_source[idx][sort_key]) for idx in range(len(data_source))),
+                dtype=np.int32,
+                count=len(data_source),
+            )
+            order = np.argsort(lens, kind="stable").tolist()
+        else:
+            order = list(range(len(data_source)))
+        self.batches = [order[i * batch_size : (i + 1) * batch_size] for i in range(num_batch)]
+
+    def __iter__(self):
+        if self.shuffle:
+            random.shuffle(self.batches)
+        yield from self.batches
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+
 class BucketIterator:
     """
     Iterator class for use with non-bert version of SenticGCN.
@@ -557,7 +800,10 @@ class BucketIterator:
         """
         num_batch = int(math.ceil(len(data) / batch_size))
         if self.sort:
-            sorted_data = sorted(data, key=lambda x: len(x[self.sort_key]))
+            # Precompute lengths once and argsort in native code instead of
+            # re-indexing the nested dicts per comparison in a python sort.
+            lens = np.fromiter((len(item[self.sort_key]) for item in data), dtype=np.int32, count=len(data))
+            sorted_data = [data[idx] for idx in np.argsort(lens, kind="stable")]
         else:
             sorted_data = data
         batches = []
@@ -575,40 +821,12 @@ class BucketIterator:
         Returns:
             Dict[str, List[torch.Tensor]]: return a dictionary of list of tensor values
         """
-        batch_text_indices = []
-        batch_aspect_indices = []
-        batch_left_indices = []
-        batch_polarity = []
-        batch_sdat_graph = []
-        max_len = max([len(t[self.sort_key]) for t in batch_data])
-        for item in batch_data:
-            (text_indices, aspect_indices, left_indices, polarity, sdat_graph,) = (
-                item["text_indices"],
-                item["aspect_indices"],
-                item["left_indices"],
-                item["polarity"],
-                item["sdat_graph"],
-            )
-            # Calculate padding length
-            text_padding = [0] * (max_len - len(text_indices))
-            aspect_padding = [0] * (max_len - len(aspect_indices))
-            left_padding = [0] * (max_len - len(left_indices))
-
-            batch_text_indices.append(text_indices + text_padding)
-            batch_aspect_indices.append(aspect_indices + aspect_padding)
-            batch_left_indices.append(left_indices + left_padding)
-            batch_polarity.append(polarity)
-            batch_sdat_graph.append(
-                np.pad(sdat_graph, ((0, max_len - len(text_indices)), (0, max_len - len(text_indices))), "constant")
-            )
-
-        return {
-            "text_indices": torch.tensor(batch_text_indices),
-            "aspect_indices": torch.tensor(batch_aspect_indices),
-            "left_indices": torch.tensor(batch_left_indices),
-            "polarity": torch.tensor(batch_polarity),
-            "sdat_graph": torch.tensor(np.array(batch_sdat_graph)),
-        }
+        batch = bucket_collate_fn(batch_data, self.sort_key)
+        # Pin batch tensors so downstream .to(device, non_blocking=True) copies
+        # can overlap with compute. Skip on CPU-only runs where pinning is wasted work.
+        if torch.cuda.is_available():
+            batch = {key: tensor.pin_memory() for key, tensor in batch.items()}
+        return batch
 
     def __iter__(self):
         if self.shuffle:
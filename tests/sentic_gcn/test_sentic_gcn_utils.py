@@ -1,4 +1,6 @@
+import os
 import pathlib
+import pickle
 import shutil
 import tempfile
 import unittest
@@ -6,11 +8,14 @@ import unittest.mock as mock
 
 import numpy as np
 import spacy
+import torch
 
 from sgnlp.models.sentic_gcn.data_class import SenticGCNTrainArgs
 from sgnlp.models.sentic_gcn.utils import (
+    BucketIterator,
     SenticGCNDataset,
     SenticGCNDatasetGenerator,
+    build_embedding_matrix,
     pad_and_truncate,
     load_and_process_senticnet,
     generate_dependency_adj_matrix,
@@ -71,6 +76,76 @@ class TestLoadandProcessSenticNetTestCase(unittest.TestCase):
         self.assertEqual(len(senticnet), 12)
 
 
+class TestBuildEmbeddingMatrixTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.embed_dim = 5
+        self.vocab = {"<pad>": 0, "<unk>": 1, "soup": 2, "new york": 3, "salty": 4}
+        self.temp_dir = tempfile.mkdtemp()
+        self.word_vec_file_path = pathlib.Path(self.temp_dir).joinpath("word_vec.txt")
+        with open(self.word_vec_file_path, "w") as f:
+            f.write("soup " + " ".join(["0.1"] * self.embed_dim) + "\n")
+            f.write("new york " + " ".join(["0.2"] * self.embed_dim) + "\n")
+            f.write("missing " + " ".join(["0.3"] * self.embed_dim) + "\n")
+            f.write("salty " + " ".join(["0.4"] * self.embed_dim) + "\n")
+        self.save_embed_file_path = pathlib.Path(self.temp_dir).joinpath("embed_matrix.npy")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_embedding_matrix(self):
+        matrix = build_embedding_matrix(str(self.word_vec_file_path), self.vocab, self.embed_dim, seed=776)
+        self.assertEqual(type(matrix), np.ndarray)
+        self.assertEqual(matrix.shape, (len(self.vocab), self.embed_dim))
+        self.assertEqual(matrix.dtype, np.float32)
+        self.assertTrue(np.allclose(matrix[2], np.full(self.embed_dim, 0.1)))
+        self.assertTrue(np.allclose(matrix[3], np.full(self.embed_dim, 0.2)))
+        self.assertTrue(np.allclose(matrix[4], np.full(self.embed_dim, 0.4)))
+        self.assertTrue(np.all(matrix[0] == 0))
+        self.assertTrue(np.any(matrix[1] != 0))
+
+    def test_build_embedding_matrix_parallel(self):
+        serial_matrix = build_embedding_matrix(str(self.word_vec_file_path), self.vocab, self.embed_dim, seed=776)
+        parallel_matrix = build_embedding_matrix(
+            str(self.word_vec_file_path), self.vocab, self.embed_dim, seed=776, num_workers=2
+        )
+        self.assertTrue(np.allclose(serial_matrix, parallel_matrix))
+
+    def test_build_embedding_matrix_save_and_load(self):
+        matrix = build_embedding_matrix(
+            str(self.word_vec_file_path),
+            self.vocab,
+            self.embed_dim,
+            save_embed_matrix=True,
+            save_embed_file_path=str(self.save_embed_file_path),
+            seed=776,
+        )
+        self.assertTrue(self.save_embed_file_path.exists())
+        loaded_matrix = build_embedding_matrix(
+            str(self.word_vec_file_path),
+            self.vocab,
+            self.embed_dim,
+            save_embed_matrix=False,
+            save_embed_file_path=str(self.save_embed_file_path),
+        )
+        self.assertEqual(loaded_matrix.dtype, np.float32)
+        self.assertTrue(np.allclose(matrix, loaded_matrix))
+
+    def test_build_embedding_matrix_stale_cache(self):
+        with open(self.save_embed_file_path, "wb") as f:
+            pickle.dump({"stale": "cache"}, f)
+        matrix = build_embedding_matrix(
+            str(self.word_vec_file_path),
+            self.vocab,
+            self.embed_dim,
+            save_embed_matrix=False,
+            save_embed_file_path=str(self.save_embed_file_path),
+            seed=776,
+        )
+        self.assertTrue(np.allclose(matrix[2], np.full(self.embed_dim, 0.1)))
+        reloaded_matrix = np.load(self.save_embed_file_path, mmap_mode="r")
+        self.assertTrue(np.allclose(matrix, reloaded_matrix))
+
+
 class TestGenerateDependencyAdjMatrixTestCase(unittest.TestCase):
     def setUp(self) -> None:
         self.test_file = pathlib.Path(PARENT_DIR).joinpath("test_data").joinpath("senticnet.txt")
@@ -85,6 +160,47 @@ class TestGenerateDependencyAdjMatrixTestCase(unittest.TestCase):
         self.assertEqual(matrix.shape, (9, 9))
 
 
+class TestBucketIteratorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_data = []
+        for seq_len in [3, 5, 2, 4, 6, 1, 5]:
+            self.test_data.append(
+                {
+                    "text_indices": list(range(1, seq_len + 1)),
+                    "aspect_indices": [1] * seq_len,
+                    "left_indices": [1] * seq_len,
+                    "polarity": seq_len % 3,
+                    "sdat_graph": np.ones((seq_len, seq_len), dtype="float32"),
+                }
+            )
+        self.batch_size = 3
+
+    def test_pad_data(self):
+        bucket_iterator = BucketIterator(self.test_data, batch_size=self.batch_size, shuffle=False)
+        self.assertEqual(bucket_iterator.batch_len, 3)
+        num_items = 0
+        for batch in bucket_iterator:
+            keys = batch.keys()
+            self.assertTrue("text_indices" in keys)
+            self.assertTrue("aspect_indices" in keys)
+            self.assertTrue("left_indices" in keys)
+            self.assertTrue("polarity" in keys)
+            self.assertTrue("sdat_graph" in keys)
+            batch_size, max_len = batch["text_indices"].shape
+            num_items += batch_size
+            self.assertEqual(batch["aspect_indices"].shape, (batch_size, max_len))
+            self.assertEqual(batch["left_indices"].shape, (batch_size, max_len))
+            self.assertEqual(batch["polarity"].shape, (batch_size,))
+            self.assertEqual(batch["sdat_graph"].shape, (batch_size, max_len, max_len))
+        self.assertEqual(num_items, len(self.test_data))
+
+    def test_pad_data_values(self):
+        bucket_iterator = BucketIterator(self.test_data, batch_size=self.batch_size, shuffle=False, sort=False)
+        batch = bucket_iterator.batches[0]
+        self.assertTrue(torch.equal(batch["text_indices"][0], torch.tensor([1, 2, 3, 0, 0])))
+        self.assertTrue(torch.equal(batch["text_indices"][1], torch.tensor([1, 2, 3, 4, 5])))
+
+
 class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
     def setUp(self) -> None:
         cfg = {
@@ -97,6 +213,12 @@ class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
         }
         self.cfg = SenticGCNTrainArgs(**cfg)
 
+    @staticmethod
+    def _fake_batch_tokenize(texts, **kwargs):
+        # Return one list of token ids per input string, with ids unique to each sample
+        # so indexing into the batched tokenizer output can be asserted per sample.
+        return {"input_ids": [[float(idx + 1)] * 5 for idx in range(len(texts))]}
+
     def test_read_raw_dataset(self):
         with mock.patch("sgnlp.models.sentic_gcn.tokenization.SenticGCNTokenizer") as MockClass:
             fake_tokenizer = MockClass()
@@ -106,27 +228,32 @@ class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
 
     def test_generate_senticgcn_dataset(self):
         with mock.patch("sgnlp.models.sentic_gcn.tokenization.SenticGCNTokenizer") as MockClass:
-            fake_tokenizer = MockClass(return_value={"input_ids": [1.0, 2.0, 3.0, 4.0, 5.0]})
+            fake_tokenizer = MockClass()
+            fake_tokenizer.side_effect = self._fake_batch_tokenize
         dataset_gen = SenticGCNDatasetGenerator(self.cfg, fake_tokenizer)
         dataset = dataset_gen._read_raw_dataset(self.cfg.dataset_train)
         data = dataset_gen._generate_senticgcn_dataset(dataset)
         self.assertEqual(len(data), 5)
-        for data_row in data:
+        for idx, data_row in enumerate(data):
             keys = data_row.keys()
             self.assertTrue("text_indices" in keys)
             self.assertTrue("aspect_indices" in keys)
             self.assertTrue("left_indices" in keys)
             self.assertTrue("polarity" in keys)
             self.assertTrue("sdat_graph" in keys)
+            self.assertEqual(data_row["text_indices"], [float(idx + 1)] * 5)
+            self.assertEqual(data_row["aspect_indices"], [float(idx + 1)] * 5)
+            self.assertEqual(data_row["left_indices"], [float(idx + 1)] * 5)
 
     def test_generate_senticgcn_bert_dataset(self):
         with mock.patch("sgnlp.models.sentic_gcn.tokenization.SenticGCNBertTokenizer") as MockClass:
-            fake_tokenizer = MockClass(return_value={"input_ids": [1.0, 2.0, 3.0, 4.0, 5.0]})
+            fake_tokenizer = MockClass()
+            fake_tokenizer.side_effect = self._fake_batch_tokenize
         dataset_gen = SenticGCNDatasetGenerator(self.cfg, fake_tokenizer)
         dataset = dataset_gen._read_raw_dataset(self.cfg.dataset_train)
         data = dataset_gen._generate_senticgcnbert_dataset(dataset)
         self.assertEqual(len(data), 5)
-        for data_row in data:
+        for idx, data_row in enumerate(data):
             keys = data_row.keys()
             self.assertTrue("text_indices" in keys)
             self.assertTrue("aspect_indices" in keys)
@@ -135,6 +262,10 @@ class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
             self.assertTrue("bert_segment_indices" in keys)
             self.assertTrue("polarity" in keys)
             self.assertTrue("sdat_graph" in keys)
+            self.assertTrue(torch.equal(data_row["text_indices"], torch.tensor([float(idx + 1)] * 5)))
+            self.assertTrue(torch.equal(data_row["aspect_indices"], torch.tensor([float(idx + 1)] * 5)))
+            self.assertTrue(torch.equal(data_row["left_indices"], torch.tensor([float(idx + 1)] * 5)))
+            self.assertTrue(torch.equal(data_row["text_bert_indices"], torch.tensor([float(idx + 1)] * 5)))
 
     def test_generate_dataset(self):
         for model_type in ["senticgcn", "senticgcnbert"]:
@@ -145,7 +276,8 @@ class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
                 else "sgnlp.models.sentic_gcn.tokenization.SenticGCNBertTokenizer"
             )
             with mock.patch(class_path) as MockClass:
-                fake_tokenizer = MockClass(return_value={"input_ids": [1.0, 2.0, 3.0, 4.0, 5.0]})
+                fake_tokenizer = MockClass()
+                fake_tokenizer.side_effect = self._fake_batch_tokenize
             dataset_gen = SenticGCNDatasetGenerator(self.cfg, fake_tokenizer)
             train_data, val_data, test_data = dataset_gen.generate_datasets()
             self.assertEqual(type(train_data), SenticGCNDataset)
@@ -154,3 +286,64 @@ class TestSenticGCNDatasetGeneratorTestCase(unittest.TestCase):
             self.assertEqual(len(train_data), 5)
             self.assertEqual(len(val_data), 5)
             self.assertEqual(len(test_data), 5)
+
+
+class TestSenticGCNDatasetGeneratorCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.dataset_file_path = pathlib.Path(self.temp_dir).joinpath("test_train.raw")
+        shutil.copy(PARENT_DIR + "/test_data/test_train.raw", self.dataset_file_path)
+        cfg = {
+            "senticnet_word_file_path": PARENT_DIR + "/test_data/senticnet.txt",
+            "saved_preprocessed_senticnet_file_path": str(pathlib.Path(self.temp_dir).joinpath("senticnet.pickle")),
+            "spacy_pipeline": "en_core_web_sm",
+            "dataset_train": [str(self.dataset_file_path)],
+            "dataset_test": [str(self.dataset_file_path)],
+            "valset_ratio": 0,
+            "model": "senticgcn",
+            "save_preprocessed_dataset": True,
+            "saved_preprocessed_dataset_folder": str(pathlib.Path(self.temp_dir).joinpath("preprocessed_dataset")),
+        }
+        self.cfg = SenticGCNTrainArgs(**cfg)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_dataset_generator(self) -> SenticGCNDatasetGenerator:
+        with mock.patch("sgnlp.models.sentic_gcn.tokenization.SenticGCNTokenizer") as MockClass:
+            fake_tokenizer = MockClass()
+            fake_tokenizer.side_effect = lambda texts, **kwargs: {"input_ids": [[1, 2, 3] for _ in texts]}
+            fake_tokenizer.vocab_size = 100
+        return SenticGCNDatasetGenerator(self.cfg, fake_tokenizer)
+
+    def test_generate_dataset_cache_roundtrip(self):
+        dataset_gen = self._create_dataset_generator()
+        cache_file_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        data = dataset_gen._generate_dataset(self.cfg.dataset_train)
+        self.assertEqual(len(data), 5)
+        self.assertTrue(cache_file_path.exists())
+        # Replace the cache with a sentinel to prove the second call loads from cache
+        sentinel = [{"polarity": 99}]
+        with open(cache_file_path, "wb") as f:
+            pickle.dump(sentinel, f)
+        cached_data = dataset_gen._generate_dataset(self.cfg.dataset_train)
+        self.assertEqual(cached_data, sentinel)
+
+    def test_cache_file_path_changes_with_dataset_file(self):
+        dataset_gen = self._create_dataset_generator()
+        original_file_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        file_stat = self.dataset_file_path.stat()
+        os.utime(self.dataset_file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1))
+        changed_file_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        self.assertNotEqual(original_file_path, changed_file_path)
+
+    def test_cache_file_path_changes_with_tokenizer_and_model(self):
+        dataset_gen = self._create_dataset_generator()
+        original_file_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        dataset_gen.tokenizer.vocab_size = 200
+        changed_tokenizer_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        self.assertNotEqual(original_file_path, changed_tokenizer_path)
+        dataset_gen.tokenizer.vocab_size = 100
+        self.cfg.model = "senticgcnbert"
+        changed_model_path = dataset_gen._saved_preprocessed_dataset_file_path(self.cfg.dataset_train)
+        self.assertNotEqual(original_file_path, changed_model_path)